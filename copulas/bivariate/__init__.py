@@ -1,12 +1,11 @@
 import numpy as np
-import pandas as pd
+from scipy import stats
 
 from copulas import EPSILON
 from copulas.bivariate.base import Bivariate, CopulaTypes
 from copulas.bivariate.clayton import Clayton
 from copulas.bivariate.frank import Frank
 from copulas.bivariate.gumbel import Gumbel
-from copulas.bivariate.utils import split_matrix
 
 __all__ = (
     'Bivariate',
@@ -27,31 +26,27 @@ def _compute_empirical(X):
         X(numpy.array): Shape (n,2); Datapoints to compute the empirical(frequentist) copula.
 
     Return:
-        tuple(list):
+        tuple(numpy.ndarray):
 
     """
-    z_left = []
-    z_right = []
-    L = []
-    R = []
-
-    U, V = split_matrix(X)
-    N = len(U)
+    N = len(X)
     base = np.linspace(EPSILON, 1.0 - EPSILON, COMPUTE_EMPIRICAL_STEPS)
     # See https://github.com/sdv-dev/Copulas/issues/45
 
-    for k in range(COMPUTE_EMPIRICAL_STEPS):
-        left = sum(np.logical_and(U <= base[k], V <= base[k])) / N
-        right = sum(np.logical_and(U >= base[k], V >= base[k])) / N
-
-        if left > 0:
+    # A point is on both left tails iff its maximum is, and on both right tails iff
+    # its minimum is, so all the counts can be read from two sorted arrays at once.
+    sorted_max = np.sort(X.max(axis=1))
+    sorted_min = np.sort(X.min(axis=1))
+    left = np.searchsorted(sorted_max, base, side='right') / N
+    right = (N - np.searchsorted(sorted_min, base, side='left')) / N
 
-            z_left.append(base[k])
-            L.append(left / base[k] ** 2)
+    left_mask = left > 0
+    right_mask = right > 0
 
-        if right > 0:
-            z_right.append(base[k])
-            R.append(right / (1 - z_right[k]) ** 2)
+    z_left = base[left_mask]
+    z_right = base[right_mask]
+    L = left[left_mask] / z_left ** 2
+    R = right[right_mask] / (1 - z_right) ** 2
 
     return z_left, L, z_right, R
 
@@ -71,7 +66,8 @@ def _compute_tail(c, z):
         numpy.ndarray
 
     """
-    return np.divide(1.0 - 2 * np.asarray(z) + c, np.power(1.0 - np.asarray(z), 2))
+    z = np.asarray(z)
+    return (1.0 - 2 * z + c) / (1.0 - z) ** 2
 
 
 def _compute_candidates(copulas, left_tail, right_tail):
@@ -83,19 +79,19 @@ def _compute_candidates(copulas, left_tail, right_tail):
         z_right(list):
 
     Returns:
-        tuple[list]: Arrays of left and right dependencies for the empirical copula.
+        tuple[numpy.ndarray]: Arrays of left and right dependencies for the empirical copula,
+        with one row per copula.
 
 
     """
-    left = []
-    right = []
-
-    X_left = np.column_stack((left_tail, left_tail))
-    X_right = np.column_stack((right_tail, right_tail))
+    # Evaluate both tails on a single call per copula, and split them afterwards
+    n_left = len(left_tail)
+    tails = np.concatenate((left_tail, right_tail))
+    X = np.column_stack((tails, tails))
+    cdfs = np.array([copula.cumulative_distribution(X) for copula in copulas])
 
-    for copula in copulas:
-        left.append(copula.cumulative_distribution(X_left) / np.power(left_tail, 2))
-        right.append(_compute_tail(copula.cumulative_distribution(X_right), right_tail))
+    left = cdfs[:, :n_left] / left_tail ** 2
+    right = _compute_tail(cdfs[:, n_left:], right_tail)
 
     return left, right
 
@@ -151,24 +147,15 @@ def select_copula(X):
     candidate_left_auts, candidate_right_auts = _compute_candidates(
         copula_candidates, left_tail, right_tail)
 
-    empirical_aut = np.concatenate((empirical_left_aut, empirical_right_aut))
-    candidate_auts = [
-        np.concatenate((left, right)) for left, right in zip(
-            candidate_left_auts, candidate_right_auts
-        )
-    ]
-
     # compute L2 distance from empirical distribution
-    diff_left = [np.sum((empirical_left_aut - left) ** 2) for left in candidate_left_auts]
-    diff_right = [np.sum((empirical_right_aut - right) ** 2) for right in candidate_right_auts]
-    diff_both = [np.sum((empirical_aut - candidate) ** 2) for candidate in candidate_auts]
-
-    # calcule ranks
-    score_left = pd.Series(diff_left).rank(ascending=False)
-    score_right = pd.Series(diff_right).rank(ascending=False)
-    score_both = pd.Series(diff_both).rank(ascending=False)
+    # The distance on both tails is the sum of the distances on each of them
+    diff_left = np.sum((candidate_left_auts - empirical_left_aut) ** 2, axis=1)
+    diff_right = np.sum((candidate_right_auts - empirical_right_aut) ** 2, axis=1)
+    diff_both = diff_left + diff_right
 
-    score = score_left + score_right + score_both
+    # calcule ranks, the largest distance getting the lowest rank
+    diffs = np.stack((diff_left, diff_right, diff_both))
+    score = stats.rankdata(-diffs, axis=1).sum(axis=0)
 
-    selected_copula = np.argmax(score.values)
+    selected_copula = np.argmax(score)
     return copula_candidates[selected_copula]
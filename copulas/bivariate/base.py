@@ -10,6 +10,7 @@ from scipy.optimize import brentq
 
 from copulas import EPSILON, NotFittedError, random_state
 from copulas.bivariate.utils import split_matrix
+from copulas.optimize import chandrupatla
 
 
 class CopulaTypes(Enum):
@@ -41,6 +42,7 @@ class Bivariate(object):
     Attributes:
         copula_type(CopulaTypes): Family of the copula a subclass belongs to.
         _subclasses(list[type]): List of declared subclasses.
+        _subclasses_by_type(dict[CopulaTypes, type]): Declared subclasses by copula family.
         theta_interval(list[float]): Interval of valid thetas for the given copula family.
         invalid_thetas(list[float]): Values that, even though they belong to
             :attr:`theta_interval`, shouldn't be considered valid.
@@ -51,6 +53,7 @@ class Bivariate(object):
 
     copula_type = None
     _subclasses = []
+    _subclasses_by_type = {}
     theta_interval = []
     invalid_thetas = []
     theta = None
@@ -84,6 +87,23 @@ class Bivariate(object):
 
         return cls._subclasses
 
+    @classmethod
+    def _get_subclasses_by_type(cls):
+        """Return a dict of the subclasses for the current class object by their copula family.
+
+        Returns:
+            dict[CopulaTypes, Bivariate]: First subclass declared for each copula family.
+
+        """
+        if not cls._subclasses_by_type:
+            subclasses_by_type = {}
+            for subclass in cls.subclasses():
+                subclasses_by_type.setdefault(subclass.copula_type, subclass)
+
+            cls._subclasses_by_type = subclasses_by_type
+
+        return cls._subclasses_by_type
+
     def __new__(cls, *args, **kwargs):
         """Create and return a new object.
 
@@ -100,9 +120,9 @@ class Bivariate(object):
             else:
                 raise ValueError('Invalid copula type {}'.format(copula_type))
 
-        for subclass in cls.subclasses():
-            if subclass.copula_type is copula_type:
-                return super(Bivariate, cls).__new__(subclass)
+        subclass = cls._get_subclasses_by_type().get(copula_type)
+        if subclass is not None:
+            return super(Bivariate, cls).__new__(subclass)
 
     def __init__(self, copula_type=None, random_seed=None):
         """Initialize Bivariate object.
@@ -149,12 +169,16 @@ class Bivariate(object):
         Raises:
             ValueError: If the data does not appear uniformly distributed.
         """
-        if min(u) < 0.0 or max(u) > 1.0:
-            raise ValueError("Marginal value out of bounds.")
+        if len(u) == 0:
+            raise ValueError("Marginal is empty.")
 
+        # The bounds are read from the sorted values needed for the KS statistic
         emperical_cdf = np.sort(u)
+        if emperical_cdf[0] < 0.0 or emperical_cdf[-1] > 1.0:
+            raise ValueError("Marginal value out of bounds.")
+
         uniform_cdf = np.linspace(0.0, 1.0, num=len(u))
-        ks_statistic = max(np.abs(emperical_cdf - uniform_cdf))
+        ks_statistic = np.abs(emperical_cdf - uniform_cdf).max()
         if ks_statistic > 1.627 / np.sqrt(len(u)):
             # KS test with significance level 0.01
             warnings.warn("Data does not appear to be uniform.", category=RuntimeWarning)
@@ -289,18 +313,38 @@ class Bivariate(object):
             v: `np.ndarray` given value of v.
         """
         self.check_fit()
-        result = []
-        for _y, _v in zip(y, V):
+        y = np.asarray(y, dtype=np.float64)
+        V = np.asarray(V, dtype=np.float64)
+
+        xmin = np.full(len(y), EPSILON)
+        xmax = np.ones(len(y))
+        f_min = self.partial_derivative(np.column_stack((xmin, V))) - y
+        f_max = self.partial_derivative(np.column_stack((xmax, V))) - y
+
+        # Solve all the bracketed roots at once, and fall back to ``brentq``
+        # on the points where the derivative can't be evaluated on the bounds.
+        bracketed = np.sign(f_min) * np.sign(f_max) <= 0
+        result = np.empty(len(y))
+        if bracketed.any():
+            _y = y[bracketed]
+            _V = V[bracketed]
+
+            def f(u):
+                return self.partial_derivative(np.column_stack((u, _V))) - _y
+
+            result[bracketed] = chandrupatla(f, xmin[bracketed], xmax[bracketed])
+
+        for index in np.flatnonzero(~bracketed):
             def f(u):
-                return self.partial_derivative_scalar(u, _v) - _y
+                return self.partial_derivative_scalar(u, V[index]) - y[index]
 
             minimum = brentq(f, EPSILON, 1.0)
             if isinstance(minimum, np.ndarray):
                 minimum = minimum[0]
 
-            result.append(minimum)
+            result[index] = minimum
 
-        return np.array(result)
+        return result
 
     def ppf(self, y, V):
         """Shortcut to :meth:`percent_point`."""
@@ -351,7 +395,8 @@ class Bivariate(object):
             np.ndarray: Array of length `n_samples` with generated data from the model.
 
         """
-        if self.tau > 1 or self.tau < -1:
+        # Copulas built from a known theta have no tau to check
+        if self.tau is not None and (self.tau > 1 or self.tau < -1):
             raise ValueError("The range for correlation measure is [-1,1].")
 
         v = np.random.uniform(0, 1, n_samples)
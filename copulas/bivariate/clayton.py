@@ -50,10 +50,10 @@ class Clayton(Bivariate):
 
         U, V = split_matrix(X)
 
-        a = (self.theta + 1) * np.power(np.multiply(U, V), -(self.theta + 1))
-        b = np.power(U, -self.theta) + np.power(V, -self.theta) - 1
+        a = (self.theta + 1) * (U * V) ** -(self.theta + 1)
+        b = U ** -self.theta + V ** -self.theta - 1
         c = -(2 * self.theta + 1) / self.theta
-        return a * np.power(b, c)
+        return a * b ** c
 
     def cumulative_distribution(self, X):
         """Compute the cumulative distribution function for the clayton copula.
@@ -74,20 +74,14 @@ class Clayton(Bivariate):
 
         U, V = split_matrix(X)
 
-        if (V == 0).all() or (U == 0).all():
-            return np.zeros(V.shape[0])
+        cdfs = np.zeros(len(U))
+        positive = (U > 0) & (V > 0)
+        if positive.any():
+            U = U[positive]
+            V = V[positive]
+            cdfs[positive] = (U ** -self.theta + V ** -self.theta - 1) ** (-1.0 / self.theta)
 
-        else:
-            cdfs = [
-                np.power(
-                    np.power(U[i], -self.theta) + np.power(V[i], -self.theta) - 1,
-                    -1.0 / self.theta
-                )
-                if (U[i] > 0 and V[i] > 0) else 0
-                for i in range(len(U))
-            ]
-
-            return np.array(cdfs)
+        return cdfs
 
     def percent_point(self, y, V):
         """Compute the inverse of conditional cumulative distribution :math:`C(u|v)^{-1}`.
@@ -132,16 +126,17 @@ class Clayton(Bivariate):
 
         U, V = split_matrix(X)
 
-        A = np.power(V, -self.theta - 1)
+        V_theta = V ** -self.theta
+        A = V_theta / V
 
         # If theta tends to inf, A tends to inf
         # And the next partial_derivative tends to 0
         if (A == np.inf).any():
             return np.zeros(len(V))
 
-        B = np.power(V, -self.theta) + np.power(U, -self.theta) - 1
-        h = np.power(B, (-1 - self.theta) / self.theta)
-        return np.multiply(A, h)
+        B = V_theta + U ** -self.theta - 1
+        h = B ** ((-1 - self.theta) / self.theta)
+        return A * h
 
     def compute_theta(self):
         r"""Compute theta parameter using Kendall's tau.
@@ -1,16 +1,66 @@
 import sys
 
 import numpy as np
-import scipy.integrate as integrate
-from scipy.optimize import least_squares
+from scipy.optimize import brentq
 
-from copulas import EPSILON
 from copulas.bivariate.base import Bivariate, CopulaTypes
 from copulas.bivariate.utils import split_matrix
 
 MIN_FLOAT_LOG = np.log(sys.float_info.min)
 MAX_FLOAT_LOG = np.log(sys.float_info.max)
 
+# Values of the Debye function of first order, tabulated once from the trapezoidal rule
+# on a fine grid. Past the end of the grid the integral is constant up to e^-50.
+DEBYE_GRID = np.linspace(0.0, 50.0, 2 ** 16 + 1)
+DEBYE_VALUES = np.ones(len(DEBYE_GRID))
+DEBYE_VALUES[1:] = DEBYE_GRID[1:] / np.expm1(DEBYE_GRID[1:])
+DEBYE_VALUES[1:] = np.cumsum(
+    (DEBYE_VALUES[1:] + DEBYE_VALUES[:-1]) * np.diff(DEBYE_GRID) / 2) / DEBYE_GRID[1:]
+DEBYE_SERIES_LIMIT = 0.1
+
+
+def _debye(alpha):
+    r"""Compute the Debye function of first order from its tabulated values.
+
+    Close to zero its Taylor series is used instead. For negative values, the identity
+    :math:`D_1(-x) = D_1(x) + \frac{x}{2}` is used.
+
+    Args:
+        alpha (float or numpy.ndarray): Values where to evaluate :math:`D_1`.
+
+    Returns:
+        numpy.ndarray
+    """
+    abs_alpha = np.abs(alpha)
+    with np.errstate(divide='ignore'):
+        debye = np.select(
+            [abs_alpha < DEBYE_SERIES_LIMIT, abs_alpha <= DEBYE_GRID[-1]],
+            [
+                1 - abs_alpha / 4 + abs_alpha ** 2 / 36 - abs_alpha ** 4 / 3600,
+                np.interp(abs_alpha, DEBYE_GRID, DEBYE_VALUES)
+            ],
+            np.pi ** 2 / 6 / abs_alpha
+        )
+
+    return np.where(np.less(alpha, 0), debye + abs_alpha / 2, debye)
+
+
+def _debye_ratio(alpha):
+    r"""Compute :math:`(D_1(x) - 1) / x` without cancellation close to zero.
+
+    Args:
+        alpha (float or numpy.ndarray): Values where to evaluate the ratio.
+
+    Returns:
+        numpy.ndarray
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(
+            np.abs(alpha) < DEBYE_SERIES_LIMIT,
+            -1 / 4 + alpha / 36 - alpha ** 3 / 3600,
+            (_debye(alpha) - 1) / alpha
+        )
+
 
 class Frank(Bivariate):
     """Class for Frank copula model."""
@@ -21,7 +71,7 @@ class Frank(Bivariate):
 
     def generator(self, t):
         """Return the generator function."""
-        a = (np.exp(-self.theta * t) - 1) / (np.exp(-self.theta) - 1)
+        a = np.expm1(-self.theta * t) / np.expm1(-self.theta)
         return -np.log(a)
 
     def _g(self, z):
@@ -36,7 +86,7 @@ class Frank(Bivariate):
             np.ndarray
 
         """
-        return np.exp(np.multiply(-self.theta, z)) - 1
+        return np.expm1(-self.theta * z)
 
     def probability_density(self, X):
         r"""Compute probability density function for given copula family.
@@ -62,12 +112,15 @@ class Frank(Bivariate):
         U, V = split_matrix(X)
 
         if self.theta == 0:
-            return np.multiply(U, V)
+            return U * V
 
         else:
-            num = np.multiply(np.multiply(-self.theta, self._g(1)), 1 + self._g(np.add(U, V)))
-            aux = np.multiply(self._g(U), self._g(V)) + self._g(1)
-            den = np.power(aux, 2)
+            # 1 + g(u + v) is computed as exp(-theta (u + v)) and g(u) g(v) + g(1) as
+            # exp(-theta u) g(v) + exp(-theta v) g(1 - v) to avoid the cancellations.
+            exp_v = np.exp(-self.theta * V)
+            num = -self.theta * self._g(1) * np.exp(-self.theta * (U + V))
+            aux = np.exp(-self.theta * U) * self._g(V) + exp_v * self._g(1 - V)
+            den = aux * aux
             return num / den
 
     def cumulative_distribution(self, X):
@@ -90,13 +143,10 @@ class Frank(Bivariate):
 
         U, V = split_matrix(X)
 
-        num = np.multiply(
-            np.exp(np.multiply(-self.theta, U)) - 1,
-            np.exp(np.multiply(-self.theta, V)) - 1
-        )
-        den = np.exp(-self.theta) - 1
+        num = self._g(U) * self._g(V)
+        den = self._g(1)
 
-        return -1.0 / self.theta * np.log(1 + num / den)
+        return -1.0 / self.theta * np.log1p(num / den)
 
     def percent_point(self, y, V):
         """Compute the inverse of conditional cumulative distribution :math:`C(u|v)^{-1}`.
@@ -137,8 +187,12 @@ class Frank(Bivariate):
             return V
 
         else:
-            num = np.multiply(self._g(U), self._g(V)) + self._g(U)
-            den = np.multiply(self._g(U), self._g(V)) + self._g(1)
+            # Both terms are rearranged so that their sums have no cancellation:
+            # 1 + g(v) = exp(-theta v) and g(u) g(v) + g(1) = exp(-theta u) g(v) +
+            # exp(-theta v) g(1 - v), whose two terms have the same sign.
+            exp_v = np.exp(-self.theta * V)
+            num = self._g(U) * exp_v
+            den = np.exp(-self.theta * U) * self._g(V) + exp_v * self._g(1 - V)
             return num / den
 
     def compute_theta(self):
@@ -157,14 +211,18 @@ class Frank(Bivariate):
 
         .. math:: D_1(x) = \frac{1}{x}\int_0^x\frac{t}{e^t -1} \mathrm{d}t.
 
+        As the right hand side is increasing in :math:`\theta`, its root is found with
+        ``brentq``. If :math:`\tau` is so close to 1 or -1 that the root is not within
+        the range of the float logarithms, the closest bound is returned.
         """
-        result = least_squares(self._tau_to_theta, 1, bounds=(MIN_FLOAT_LOG, MAX_FLOAT_LOG))
-        return result.x[0]
+        if self._tau_to_theta(MAX_FLOAT_LOG) <= 0:
+            return MAX_FLOAT_LOG
+
+        if self._tau_to_theta(MIN_FLOAT_LOG) >= 0:
+            return MIN_FLOAT_LOG
+
+        return brentq(self._tau_to_theta, MIN_FLOAT_LOG, MAX_FLOAT_LOG)
 
     def _tau_to_theta(self, alpha):
         """Relationship between tau and theta as a solvable equation."""
-        def debye(t):
-            return t / (np.exp(t) - 1)
-
-        debye_value = integrate.quad(debye, EPSILON, alpha)[0] / alpha
-        return 4 * (debye_value - 1) / alpha + 1 - self.tau
+        return 4 * _debye_ratio(alpha) + 1 - self.tau
@@ -43,14 +43,14 @@ class Gumbel(Bivariate):
         U, V = split_matrix(X)
 
         if self.theta == 1:
-            return np.multiply(U, V)
+            return U * V
 
         else:
-            a = np.power(np.multiply(U, V), -1)
-            tmp = np.power(-np.log(U), self.theta) + np.power(-np.log(V), self.theta)
-            b = np.power(tmp, -2 + 2.0 / self.theta)
-            c = np.power(np.multiply(np.log(U), np.log(V)), self.theta - 1)
-            d = 1 + (self.theta - 1) * np.power(tmp, -1.0 / self.theta)
+            a = 1 / (U * V)
+            tmp = (-np.log(U)) ** self.theta + (-np.log(V)) ** self.theta
+            b = tmp ** (-2 + 2.0 / self.theta)
+            c = (np.log(U) * np.log(V)) ** (self.theta - 1)
+            d = 1 + (self.theta - 1) * tmp ** (-1.0 / self.theta)
             return self.cumulative_distribution(X) * a * b * c * d
 
     def cumulative_distribution(self, X):
@@ -73,11 +73,11 @@ class Gumbel(Bivariate):
         U, V = split_matrix(X)
 
         if self.theta == 1:
-            return np.multiply(U, V)
+            return U * V
 
         else:
-            h = np.power(-np.log(U), self.theta) + np.power(-np.log(V), self.theta)
-            h = -np.power(h, 1.0 / self.theta)
+            h = (-np.log(U)) ** self.theta + (-np.log(V)) ** self.theta
+            h = -h ** (1.0 / self.theta)
             cdfs = np.exp(h)
             return cdfs
 
@@ -122,12 +122,14 @@ class Gumbel(Bivariate):
             return V
 
         else:
-            t1 = np.power(-np.log(U), self.theta)
-            t2 = np.power(-np.log(V), self.theta)
-            p1 = self.cumulative_distribution(X)
-            p2 = np.power(t1 + t2, -1 + 1.0 / self.theta)
-            p3 = np.power(-np.log(V), self.theta - 1)
-            return np.divide(np.multiply(np.multiply(p1, p2), p3), V)
+            minus_log_v = -np.log(V)
+            t1 = (-np.log(U)) ** self.theta
+            t2 = minus_log_v ** self.theta
+            h = t1 + t2
+            p1 = np.exp(-h ** (1.0 / self.theta))
+            p2 = h ** (-1 + 1.0 / self.theta)
+            p3 = minus_log_v ** (self.theta - 1)
+            return p1 * p2 * p3 / V
 
     def compute_theta(self):
         r"""Compute theta parameter using Kendall's tau.
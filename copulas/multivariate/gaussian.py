@@ -4,7 +4,7 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import linalg, stats
 
 from copulas import (
     EPSILON, check_valid_values, get_instance, get_qualified_name, random_state, store_args)
@@ -135,7 +135,20 @@ class GaussianMultivariate(Multivariate):
         """
         self.check_fit()
         transformed = self._transform_to_normal(X)
-        return stats.multivariate_normal.pdf(transformed, cov=self.covariance)
+
+        # Evaluate the normal density through the Cholesky factor of the covariance,
+        # so that only a triangular solve is needed to get the quadratic form.
+        cholesky = linalg.cholesky(self.covariance, lower=True)
+        z = linalg.solve_triangular(cholesky, transformed.T, lower=True)
+        log_det = np.log(np.diag(cholesky)).sum()
+        log_density = -0.5 * (
+            np.einsum('ij,ij->j', z, z) + len(cholesky) * np.log(2 * np.pi)) - log_det
+
+        density = np.exp(log_density)
+        if len(density) == 1:
+            return density[0]
+
+        return density
 
     def cumulative_distribution(self, X):
         """Compute the cumulative distribution value for each point in X.
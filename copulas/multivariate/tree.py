@@ -117,16 +117,19 @@ class Tree(Multivariate):
 
         for i in range(num_edges):
             edge = self.edges[i]
-            for j in edge.neighbors:
-                if self.level == 1:
-                    left_u = self.u_matrix[:, edge.L]
-                    right_u = self.u_matrix[:, edge.R]
+            if not edge.neighbors:
+                continue
+
+            if self.level == 1:
+                left_u = self.u_matrix[:, edge.L]
+                right_u = self.u_matrix[:, edge.R]
 
-                else:
-                    left_parent, right_parent = edge.parents
-                    left_u, right_u = Edge.get_conditional_uni(left_parent, right_parent)
+            else:
+                left_parent, right_parent = edge.parents
+                left_u, right_u = Edge.get_conditional_uni(left_parent, right_parent)
 
-                tau[i, j], pvalue = scipy.stats.kendalltau(left_u, right_u)
+            # The values only depend on the edge, so tau is shared by all its neighbors
+            tau[i, edge.neighbors], pvalue = scipy.stats.kendalltau(left_u, right_u)
 
         return tau
 
@@ -577,7 +580,7 @@ class Edge(object):
         """
         [ed1, ed2, depend_set] = cls._identify_eds_ing(left_parent, right_parent)
         left_u, right_u = cls.get_conditional_uni(left_parent, right_parent)
-        X = np.array([[x, y] for x, y in zip(left_u, right_u)])
+        X = np.column_stack((left_u, right_u))
         copula = Bivariate.select_copula(X)
         name, theta = copula.copula_type, copula.theta
         new_edge = Edge(index, ed1, ed2, name, theta)
@@ -1,8 +1,12 @@
 import numpy as np
 from scipy import stats
 
-from copulas.bivariate import select_copula
+from copulas import EPSILON
+from copulas.bivariate import (
+    COMPUTE_EMPIRICAL_STEPS, _compute_candidates, _compute_empirical, _compute_tail, select_copula)
+from copulas.bivariate.clayton import Clayton
 from copulas.bivariate.frank import Frank
+from copulas.bivariate.independence import Independence
 
 
 def test_select_copula_negative_tau():
@@ -21,3 +25,77 @@ def test_select_copula_negative_tau():
 
     # Check
     assert isinstance(copula, Frank)
+
+
+def test_select_copula_positive_tau():
+    """If tau is positive, should choose the copula whose tails fit the data best."""
+    # Setup
+    clayton = Clayton(random_seed=0)
+    clayton.tau = 0.6
+    clayton._compute_theta()
+    X = clayton.sample(300)
+
+    # Run
+    copula = select_copula(X)
+
+    # Check
+    assert isinstance(copula, Clayton)
+
+
+def test__compute_empirical():
+    """The empirical tails are the fraction of points on both tails, normalized."""
+    # Setup
+    X = np.array([
+        [0.1, 0.2],
+        [0.3, 0.25],
+        [0.5, 0.7],
+        [0.9, 0.8],
+    ])
+
+    # Run
+    z_left, L, z_right, R = _compute_empirical(X)
+
+    # Check
+    base = np.linspace(EPSILON, 1.0 - EPSILON, COMPUTE_EMPIRICAL_STEPS)
+    left = np.array([np.logical_and(X[:, 0] <= z, X[:, 1] <= z).mean() for z in base])
+    right = np.array([np.logical_and(X[:, 0] >= z, X[:, 1] >= z).mean() for z in base])
+
+    np.testing.assert_allclose(z_left, base[left > 0])
+    np.testing.assert_allclose(L, left[left > 0] / base[left > 0] ** 2)
+    np.testing.assert_allclose(z_right, base[right > 0])
+    np.testing.assert_allclose(R, right[right > 0] / (1 - base[right > 0]) ** 2)
+
+
+def test__compute_tail():
+    """_compute_tail accepts the values of several copulas at once."""
+    # Setup
+    z = [0.2, 0.5]
+    c = np.array([
+        [0.04, 0.25],
+        [0.1, 0.4],
+    ])
+    expected_result = np.array([
+        [0.64 / 0.64, 0.25 / 0.25],
+        [0.7 / 0.64, 0.4 / 0.25],
+    ])
+
+    # Run
+    result = _compute_tail(c, z)
+
+    # Check
+    np.testing.assert_allclose(result, expected_result)
+
+
+def test__compute_candidates():
+    """_compute_candidates returns the tail dependencies of each copula in a row."""
+    # Setup
+    copulas = [Independence(), Independence()]
+    left_tail = np.array([0.1, 0.2, 0.3])
+    right_tail = np.array([0.6, 0.8])
+
+    # Run
+    left, right = _compute_candidates(copulas, left_tail, right_tail)
+
+    # Check
+    np.testing.assert_allclose(left, np.ones((2, 3)))
+    np.testing.assert_allclose(right, np.ones((2, 2)))
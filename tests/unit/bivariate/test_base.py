@@ -3,6 +3,8 @@ from unittest import TestCase, mock
 import numpy as np
 
 from copulas.bivariate.base import Bivariate, CopulaTypes
+from copulas.bivariate.clayton import Clayton
+from copulas.bivariate.gumbel import Gumbel
 from tests import compare_nested_dicts
 
 
@@ -27,6 +29,21 @@ class TestBivariate(TestCase):
         # Check
         assert instance.random_seed == 'random_seed'
 
+    def test___new__copula_type(self):
+        """Passing a copula_type returns an instance of the matching subclass."""
+        # Run
+        by_enum = Bivariate(copula_type=CopulaTypes.GUMBEL)
+        by_name = Bivariate(copula_type='clayton')
+
+        # Check
+        assert isinstance(by_enum, Gumbel)
+        assert isinstance(by_name, Clayton)
+
+    def test___new__invalid_copula_type(self):
+        """An unknown copula_type raises a ValueError."""
+        with self.assertRaises(ValueError):
+            Bivariate(copula_type='unknown')
+
     def test_from_dict(self):
         """From_dict sets the values of a dictionary as attributes of the instance."""
         # Setup
@@ -53,7 +70,7 @@ class TestBivariate(TestCase):
         expected_result = {
             'copula_type': 'FRANK',
             "tau": 0.9128709291752769,
-            "theta": 44.2003852484162
+            "theta": 44.20038509330445
         }
 
         # Run
@@ -73,7 +90,7 @@ class TestBivariate(TestCase):
         expected_content = {
             "copula_type": "FRANK",
             "tau": 0.9128709291752769,
-            "theta": 44.2003852484162
+            "theta": 44.20038509330445
         }
 
         # Run
@@ -120,3 +137,38 @@ class TestBivariate(TestCase):
         expected_args = ((np.array([[0.5, 0.1]]), 0), {})
         assert len(expected_args) == len(derivative_mock.call_args)
         assert (derivative_mock.call_args[0][0] == expected_args[0][0]).all()
+
+    def test_sample_without_tau(self):
+        """A copula defined only by its theta can be sampled without computing tau."""
+        # Setup
+        instance = Bivariate(copula_type=CopulaTypes.CLAYTON, random_seed=0)
+        instance.theta = 2.0
+
+        # Run
+        result = instance.sample(5)
+
+        # Check
+        assert instance.tau is None
+        assert result.shape == (5, 2)
+        assert ((0 <= result) & (result <= 1)).all()
+
+    def test_check_marginal_out_of_bounds(self):
+        """check_marginal raises a ValueError if any value is out of [0, 1]."""
+        # Setup
+        instance = Bivariate(copula_type=CopulaTypes.CLAYTON)
+
+        # Run/Check
+        with self.assertRaises(ValueError):
+            instance.check_marginal(np.array([0.2, 1.1, 0.5]))
+
+        with self.assertRaises(ValueError):
+            instance.check_marginal(np.array([0.2, 0.4, -0.1]))
+
+    def test_check_marginal_empty(self):
+        """check_marginal raises a ValueError on an empty marginal."""
+        # Setup
+        instance = Bivariate(copula_type=CopulaTypes.CLAYTON)
+
+        # Run/Check
+        with self.assertRaises(ValueError):
+            instance.check_marginal(np.array([]))
@@ -57,6 +57,24 @@ class TestClayton(TestCase):
         assert isinstance(result, np.ndarray)
         assert np.isclose(result, expected_result, rtol=0.05).all()
 
+    def test_cumulative_distribution_zero_values(self):
+        """Cumulative_density returns 0 only on the points with a zero coordinate."""
+        # Setup
+        self.copula.fit(self.X)
+        expected_result = np.array([0.0, 0.1821, 0.0, 0.0])
+
+        # Run
+        result = self.copula.cumulative_distribution(np.array([
+            [0.0, 0.2],
+            [0.2, 0.2],
+            [0.6, 0.0],
+            [0.0, 0.0],
+        ]))
+
+        # Check
+        assert isinstance(result, np.ndarray)
+        assert np.isclose(result, expected_result, rtol=0.05).all()
+
     def test_partial_derivative(self):
         """Probability_density returns the probability density for the given values."""
         self.copula.fit(self.X)
@@ -82,6 +100,20 @@ class TestClayton(TestCase):
 
         assert np.isclose(U, U_inferred).all()
 
+    def test_percent_point_list_input(self):
+        """percent_point accepts plain lists as well as arrays."""
+        # Setup
+        self.copula.fit(self.X)
+        y = [0.2, 0.7]
+        V = [0.3, 0.6]
+
+        # Run
+        result = self.copula.percent_point(y, V)
+
+        # Check
+        expected_result = self.copula.percent_point(np.array(y), np.array(V))
+        np.testing.assert_allclose(result, expected_result)
+
     def test_cdf_zero_if_single_arg_is_zero(self):
         """Test of the analytical properties of copulas on a range of values of theta."""
         # Setup
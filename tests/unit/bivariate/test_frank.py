@@ -2,8 +2,9 @@ from unittest import TestCase
 from unittest.mock import patch
 
 import numpy as np
+import scipy.integrate as integrate
 
-from copulas.bivariate.frank import Frank
+from copulas.bivariate.frank import MAX_FLOAT_LOG, MIN_FLOAT_LOG, Frank, _debye
 from tests import compare_nested_iterables, copula_single_arg_not_one, copula_zero_if_arg_zero
 
 
@@ -58,6 +59,90 @@ class TestFrank(TestCase):
         assert isinstance(result, np.ndarray)
         assert np.isclose(result, expected_result, rtol=0.05).all()
 
+    def test_partial_derivative_large_theta(self):
+        """partial_derivative stays finite and reaches 1 on u = 1 for large thetas."""
+        # Setup
+        instance = Frank()
+        instance.tau = 0.95
+        instance.theta = instance.compute_theta()
+        X = np.array([
+            [1.0, 0.2],
+            [1.0, 0.8],
+            [0.5, 0.9],
+        ])
+
+        # Run
+        result = instance.partial_derivative(X)
+
+        # Check
+        assert np.isfinite(result).all()
+        np.testing.assert_allclose(result[:2], [1.0, 1.0])
+
+    def test_probability_density_large_theta(self):
+        """probability_density stays finite and accurate for large thetas."""
+        # Setup
+        instance = Frank()
+        instance.tau = 0.97
+        instance.theta = instance.compute_theta()
+        X = np.array([
+            [0.2, 0.2],
+            [0.5, 0.52],
+            [0.3, 0.7],
+            [0.9, 0.1],
+        ])
+        expected_result = np.array([
+            32.9168972463012,
+            8.233244699106752,
+            1.763908067226143e-21,
+            2.3630505378103636e-44,
+        ])
+
+        # Run
+        result = instance.probability_density(X)
+
+        # Check
+        np.testing.assert_allclose(result, expected_result, rtol=1e-10)
+
+    def test_compute_theta_bounds(self):
+        """If the root is out of the float range, compute_theta returns the closest bound."""
+        # Setup
+        instance = Frank()
+
+        # Run
+        instance.tau = 0.999
+        upper = instance.compute_theta()
+        instance.tau = -0.999
+        lower = instance.compute_theta()
+
+        # Check
+        assert upper == MAX_FLOAT_LOG
+        assert lower == MIN_FLOAT_LOG
+
+    def test_compute_theta_small_tau(self):
+        """For tau close to 0, compute_theta keeps the sign and the value theta ~ 9 tau."""
+        # Setup
+        instance = Frank()
+
+        # Run
+        instance.tau = 1e-9
+        positive = instance.compute_theta()
+        instance.tau = -1e-9
+        negative = instance.compute_theta()
+
+        # Check
+        np.testing.assert_allclose([positive, negative], [9e-9, -9e-9], rtol=1e-3)
+
+    def test_inverse_cumulative_percentile_point(self):
+        """The percentile point and partial_derivative should be inverse one of the other."""
+        self.copula.fit(self.X)
+
+        U = np.array([0.1, 0.2, 0.3])
+        V = np.array([0.3, 0.5, 0.6])
+        cdf_percentile = self.copula.partial_derivative(np.column_stack((U, V)))
+        U_inferred = self.copula.percent_point(cdf_percentile, V)
+
+        assert np.isclose(U, U_inferred).all()
+
     @patch('copulas.bivariate.base.np.random.uniform')
     def test_sample(self, uniform_mock):
         """Sample use the inverse-transform method to generate new samples."""
@@ -113,3 +198,19 @@ class TestFrank(TestCase):
             instance.tau = tau
             instance.theta = instance.compute_theta()
             copula_single_arg_not_one(instance, tolerance=1E-03)
+
+
+def test__debye():
+    """_debye matches the numerical integration of the Debye function."""
+    # Setup
+    alpha = np.array([-100.0, -17.0, -0.5, -0.05, 1e-6, 0.05, 0.5, 3.0, 17.0, 100.0])
+    expected_result = np.array([
+        integrate.quad(lambda t: t / np.expm1(t), 0, a)[0] / a
+        for a in alpha
+    ])
+
+    # Run
+    result = _debye(alpha)
+
+    # Check
+    np.testing.assert_allclose(result, expected_result, rtol=1e-7)
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 
 import numpy as np
 import pandas as pd
+from scipy import stats
 
 from copulas import get_qualified_name
 from copulas.multivariate.gaussian import GaussianMultivariate
@@ -286,6 +287,25 @@ class TestGaussianMultivariate(TestCase):
         # Check
         self.assertAlmostEqual(result, expected_result)
 
+    def test_probability_density_multiple_rows(self):
+        """Probability_density matches the multivariate normal density of the transformed rows."""
+        # Setup
+        copula = GaussianMultivariate(GaussianUnivariate)
+        copula.fit(self.data)
+        X = np.array([
+            [2000., 200., 0.],
+            [1000., 150., 1.],
+        ])
+        transformed = copula._transform_to_normal(X)
+        expected_result = stats.multivariate_normal.pdf(transformed, cov=copula.covariance)
+
+        # Run
+        result = copula.probability_density(X)
+
+        # Check
+        assert result.shape == (2, )
+        np.testing.assert_allclose(result, expected_result)
+
     def test_cumulative_distribution_fit_df_call_np_array(self):
         """Cumulative_density integrates the probability density along the given values."""
         # Setup